@@ -1,8 +1,52 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _rabbitmq_env() -> Dict[str, Any]:
+    """
+    Read and parse RabbitMQ environment variables exactly once.
+    """
+    return {
+        "host": os.getenv("RABBITMQ_HOST", "localhost"),
+        "port": int(os.getenv("RABBITMQ_PORT", 5672)),
+        "username": os.getenv("RABBITMQ_USERNAME", "guest"),
+        "password": os.getenv("RABBITMQ_PASSWORD", "guest"),
+        "virtual_host": os.getenv("RABBITMQ_VHOST", "/"),
+        "event_exchange": os.getenv("RABBITMQ_EVENT_EXCHANGE", "event_exchange"),
+        "prefetch_count": int(os.getenv("RABBITMQ_PREFETCH_COUNT", 10)),
+        "consumer_workers": int(os.getenv("RABBITMQ_CONSUMER_WORKERS", 1)),
+    }
+
+
+@lru_cache(maxsize=1)
+def _circuit_breaker_env() -> Dict[str, Any]:
+    """
+    Read and parse circuit breaker environment variables exactly once.
+    """
+    # CIRCUIT_RESET_TIMEOUT is the older name for the first wait after a trip;
+    # deployments that only set it keep their value
+    initial_backoff = os.getenv(
+        "CIRCUIT_INITIAL_BACKOFF", os.getenv("CIRCUIT_RESET_TIMEOUT", 0.5)
+    )
+
+    return {
+        "failure_threshold": int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5)),
+        "max_reset_timeout": float(os.getenv("CIRCUIT_MAX_RESET_TIMEOUT", 300.0)),
+        "backoff_factor": float(os.getenv("CIRCUIT_BACKOFF_FACTOR", 1.5)),
+        "initial_backoff": float(initial_backoff),
+        "half_open_success_threshold": int(
+            os.getenv("CIRCUIT_HALF_OPEN_SUCCESS_THRESHOLD", 3)
+        ),
+        "half_open_max_concurrent_probes": int(
+            os.getenv("CIRCUIT_HALF_OPEN_MAX_CONCURRENT_PROBES", 1)
+        ),
+    }
+
+
+@dataclass(frozen=True, slots=True)
 class RabbitMQConfig:
     """
     Configuration settings for RabbitMQ connection.
@@ -11,15 +55,23 @@ class RabbitMQConfig:
     with default values for local development.
     """
 
-    host: str = os.getenv("RABBITMQ_HOST", "localhost")
-    port: int = int(os.getenv("RABBITMQ_PORT", 5672))
-    username: str = os.getenv("RABBITMQ_USERNAME", "guest")
-    password: str = os.getenv("RABBITMQ_PASSWORD", "guest")
-    virtual_host: str = os.getenv("RABBITMQ_VHOST", "/")
-    event_exchange: str = os.getenv("RABBITMQ_EVENT_EXCHANGE", "event_exchange")
+    host: str = field(default_factory=lambda: _rabbitmq_env()["host"])
+    port: int = field(default_factory=lambda: _rabbitmq_env()["port"])
+    username: str = field(default_factory=lambda: _rabbitmq_env()["username"])
+    password: str = field(default_factory=lambda: _rabbitmq_env()["password"])
+    virtual_host: str = field(default_factory=lambda: _rabbitmq_env()["virtual_host"])
+    event_exchange: str = field(
+        default_factory=lambda: _rabbitmq_env()["event_exchange"]
+    )
+    prefetch_count: int = field(
+        default_factory=lambda: _rabbitmq_env()["prefetch_count"]
+    )
+    consumer_workers: int = field(
+        default_factory=lambda: _rabbitmq_env()["consumer_workers"]
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CircuitBreakerConfig:
     """
     Configuration parameters for circuit breaker behavior.
@@ -28,7 +80,39 @@ class CircuitBreakerConfig:
     characteristics for system resilience.
     """
 
-    failure_threshold: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", 5))
-    reset_timeout: float = float(os.getenv("CIRCUIT_RESET_TIMEOUT", 60.0))
-    max_reset_timeout: float = float(os.getenv("CIRCUIT_MAX_RESET_TIMEOUT", 300.0))
-    backoff_factor: float = float(os.getenv("CIRCUIT_BACKOFF_FACTOR", 1.5))
+    failure_threshold: int = field(
+        default_factory=lambda: _circuit_breaker_env()["failure_threshold"]
+    )
+    max_reset_timeout: float = field(
+        default_factory=lambda: _circuit_breaker_env()["max_reset_timeout"]
+    )
+    backoff_factor: float = field(
+        default_factory=lambda: _circuit_breaker_env()["backoff_factor"]
+    )
+    initial_backoff: float = field(
+        default_factory=lambda: _circuit_breaker_env()["initial_backoff"]
+    )
+    half_open_success_threshold: int = field(
+        default_factory=lambda: _circuit_breaker_env()["half_open_success_threshold"]
+    )
+    half_open_max_concurrent_probes: int = field(
+        default_factory=lambda: _circuit_breaker_env()[
+            "half_open_max_concurrent_probes"
+        ]
+    )
+
+
+@lru_cache(maxsize=1)
+def get_rabbitmq_config() -> RabbitMQConfig:
+    """
+    Get the shared RabbitMQ configuration built from the environment.
+    """
+    return RabbitMQConfig()
+
+
+@lru_cache(maxsize=1)
+def get_circuit_breaker_config() -> CircuitBreakerConfig:
+    """
+    Get the shared circuit breaker configuration built from the environment.
+    """
+    return CircuitBreakerConfig()
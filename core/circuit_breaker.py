@@ -1,12 +1,26 @@
+import threading
 import time
-import traceback
-from typing import Any, Callable, Optional
+from collections import namedtuple
+from typing import Any, Callable, Optional, Tuple
 
 from core.interfaces import CircuitBreaker, CircuitState
-from config import CircuitBreakerConfig
+from config import CircuitBreakerConfig, get_circuit_breaker_config
 from logging_utils import CorrelatedLogger
 from exceptions import CircuitBreakerError
 
+_NS_PER_SECOND = 1_000_000_000
+
+# Internal state is kept as plain ints for cheap hot-path comparisons
+_CLOSED = CircuitState.CLOSED.value
+_OPEN = CircuitState.OPEN.value
+_HALF_OPEN = CircuitState.HALF_OPEN.value
+
+# Snapshot of the breaker's logically-atomic status. It is replaced as a
+# whole under the lock, so readers never observe a half-applied transition.
+_Status = namedtuple("_Status", "state failure_count deadline_ns attempt")
+
+_CLOSED_STATUS = _Status(state=_CLOSED, failure_count=0, deadline_ns=0, attempt=0)
+
 
 class DefaultCircuitBreaker(CircuitBreaker):
     """
@@ -19,104 +33,236 @@ class DefaultCircuitBreaker(CircuitBreaker):
     - Tracks consecutive failures
     - Implements exponential backoff
     - Provides automatic recovery mechanisms
+    - Closes gradually, after several successful HALF_OPEN probes
+    - Lock-free state reads; transitions are serialized by a lock
     """
 
+    # Attach a traceback to every Nth recorded failure
+    TRACE_EVERY_N_FAILURES = 100
+
     def __init__(
         self,
-        config: CircuitBreakerConfig = CircuitBreakerConfig(),
+        config: Optional[CircuitBreakerConfig] = None,
         logger: Optional[CorrelatedLogger] = None,
     ):
         """
         Initialize circuit breaker with custom configuration.
 
         Args:
-            config (CircuitBreakerConfig): Configuration for failure detection and recovery
+            config (CircuitBreakerConfig, optional): Configuration for failure detection and recovery
             logger (CorrelatedLogger, optional): Logger for tracking circuit breaker events
+
+        Raises:
+            ValueError: If the HALF_OPEN probe settings are below 1
         """
-        self._config = config
+        self._config = config or get_circuit_breaker_config()
         self._logger = logger or CorrelatedLogger(__name__)
 
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._last_failure_time = None
-        self._current_reset_timeout = config.reset_timeout
+        # Values below 1 would leave the circuit unable to close again
+        if self._config.half_open_max_concurrent_probes < 1:
+            raise ValueError("half_open_max_concurrent_probes must be at least 1")
+        if self._config.half_open_success_threshold < 1:
+            raise ValueError("half_open_success_threshold must be at least 1")
+
+        # Copy frequently read settings off the config to skip a lookup level
+        self._failure_threshold = self._config.failure_threshold
+        self._initial_backoff = self._config.initial_backoff
+        self._backoff_factor = self._config.backoff_factor
+        self._max_reset_timeout = self._config.max_reset_timeout
+        self._half_open_success_threshold = self._config.half_open_success_threshold
+
+        self._lock = threading.Lock()
+        self._status = _CLOSED_STATUS
+        self._half_open_successes = 0
+        self._probe_slots = threading.BoundedSemaphore(
+            self._config.half_open_max_concurrent_probes
+        )
 
     def execute(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """
         Execute a function with circuit breaker protection.
         """
-        # Check circuit state
-        if self._state == CircuitState.OPEN:
-            # Check if reset timeout has passed
-            if (time.time() - self._last_failure_time) < self._current_reset_timeout:
-                error_msg = "Circuit is currently OPEN and unavailable"
-                self._logger.error(error_msg)
-                raise CircuitBreakerError(error_msg)
+        status = self._status
+
+        # Fast path: reject while OPEN without taking the lock
+        if status.state == _OPEN and time.monotonic_ns() < status.deadline_ns:
+            self._reject("Circuit is currently OPEN and unavailable")
+
+        rejected = None
+        probe = False
+        transitioned = False
+
+        # Transitions are serialized so that concurrent callers agree on who
+        # may probe a recovering service. Nothing is logged under the lock.
+        if status.state != _CLOSED:
+            with self._lock:
+                status = self._status
+                if status.state == _OPEN:
+                    # Check if reset deadline has passed
+                    if time.monotonic_ns() < status.deadline_ns:
+                        rejected = "Circuit is currently OPEN and unavailable"
+                    else:
+                        # Transition to half-open state for recovery attempt
+                        status = self._status = status._replace(state=_HALF_OPEN)
+                        self._half_open_successes = 0
+                        transitioned = True
+
+                if status.state == _HALF_OPEN:
+                    # Only a limited number of recovery probes may run at once
+                    probe = self._probe_slots.acquire(blocking=False)
+                    if not probe:
+                        rejected = (
+                            "Circuit is HALF_OPEN and recovery probes are in progress"
+                        )
 
-            # Transition to half-open state for recovery attempt
-            self._state = CircuitState.HALF_OPEN
+        if transitioned:
             self._logger.info("Circuit transitioned to HALF_OPEN state")
+        if rejected:
+            self._reject(rejected)
 
         try:
             # Execute the function
             result = func(*args, **kwargs)
 
-            # Reset tracking if previously in non-closed state
-            if self._state != CircuitState.CLOSED:
-                self._reset()
-
-            return result
-
         except Exception as e:
             # Record and handle failures
-            self._record_failure(e)
+            with self._lock:
+                failure_count, reset_timeout = self._record_failure()
+            self._log_failure(e, failure_count, reset_timeout)
             raise
 
-    def _record_failure(self, exception: Exception):
+        finally:
+            if probe:
+                self._probe_slots.release()
+
+        # Count successful recovery probes towards closing the circuit
+        if probe:
+            with self._lock:
+                successes = self._record_probe_success()
+            self._log_probe_success(successes)
+
+        return result
+
+    def _record_failure(self) -> Tuple[int, Optional[float]]:
         """
-        Record and process a failure event with exponential backoff.
+        Record a failure, tripping the circuit with exponential backoff once
+        the threshold is reached.
+
+        Must be called with ``self._lock`` held.
+
+        Returns:
+            Tuple[int, Optional[float]]: The failure count, and the reset
+            timeout if this failure opened the circuit
         """
-        self._failure_count += 1
-        self._last_failure_time = time.time()
+        threshold = self._failure_threshold
+        initial = self._initial_backoff
+        factor = self._backoff_factor
+        max_timeout = self._max_reset_timeout
 
-        # Log detailed failure information
-        self._logger.error(
-            f"Failure recorded: {exception}",
-            extra={
-                "failure_count": self._failure_count,
-                "exception_trace": traceback.format_exc(),
-            },
-        )
+        status = self._status
+        failure_count = status.failure_count + 1
 
-        # Check if failure threshold is reached
-        if self._failure_count >= self._config.failure_threshold:
-            self._state = CircuitState.OPEN
+        # Check if failure threshold is reached. Calls that started before the
+        # circuit opened must not re-trip it and extend the backoff.
+        if failure_count < threshold or status.state == _OPEN:
+            self._status = status._replace(failure_count=failure_count)
+            return failure_count, None
 
-            # Implement exponential backoff
-            self._current_reset_timeout = min(
-                self._current_reset_timeout * self._config.backoff_factor,
-                self._config.max_reset_timeout,
-            )
+        # Implement exponential backoff, starting from a short base wait
+        reset_timeout = min(initial * factor**status.attempt, max_timeout)
+        # Stop growing once capped so the power cannot overflow
+        attempt = status.attempt + 1 if reset_timeout < max_timeout else status.attempt
+
+        self._status = _Status(
+            state=_OPEN,
+            failure_count=failure_count,
+            deadline_ns=time.monotonic_ns() + int(reset_timeout * _NS_PER_SECOND),
+            attempt=attempt,
+        )
+        return failure_count, reset_timeout
+
+    def _log_failure(
+        self, exception: Exception, failure_count: int, reset_timeout: Optional[float]
+    ):
+        """
+        Log a recorded failure and, if it opened the circuit, the trip.
+        """
+        # Attach the traceback only on the first failure and every Nth one
+        # after it
+        self._logger.error(
+            "Failure recorded: %s",
+            exception,
+            exc_info=(failure_count - 1) % self.TRACE_EVERY_N_FAILURES == 0,
+            extra={"failure_count": failure_count},
+        )
 
+        if reset_timeout is not None:
             self._logger.error(
-                f"Circuit OPENED after {self._failure_count} consecutive failures. "
-                f"Next reset attempt in {self._current_reset_timeout} seconds."
+                "Circuit OPENED after %d consecutive failures. "
+                "Next reset attempt in %s seconds.",
+                failure_count,
+                reset_timeout,
             )
 
+    def _record_probe_success(self) -> int:
+        """
+        Record a successful HALF_OPEN probe, closing the circuit once enough
+        probes have succeeded.
+
+        Must be called with ``self._lock`` held.
+
+        Returns:
+            int: Successful probes so far, 0 if the circuit is no longer
+            HALF_OPEN
+        """
+        # Another probe may already have re-opened the circuit
+        if self._status.state != _HALF_OPEN:
+            return 0
+
+        self._half_open_successes += 1
+        successes = self._half_open_successes
+        if successes >= self._half_open_success_threshold:
+            self._reset()
+        return successes
+
+    def _log_probe_success(self, successes: int):
+        """
+        Log the outcome of a successful HALF_OPEN probe.
+        """
+        if not successes:
+            return
+
+        if successes >= self._half_open_success_threshold:
+            self._logger.info("Circuit reset to CLOSED state")
+            return
+
+        self._logger.info(
+            "Recovery probe succeeded",
+            extra={
+                "half_open_successes": successes,
+                "required_successes": self._half_open_success_threshold,
+            },
+        )
+
+    def _reject(self, reason: str):
+        """
+        Log and raise a rejection for a call the circuit will not let through.
+        """
+        self._logger.error(reason)
+        raise CircuitBreakerError(reason)
+
     def _reset(self):
         """
         Reset circuit breaker to initial state after successful recovery.
-        """
-        self._state = CircuitState.CLOSED
-        self._failure_count = 0
-        self._last_failure_time = None
-        self._current_reset_timeout = self._config.reset_timeout
 
-        self._logger.info("Circuit reset to CLOSED state")
+        Must be called with ``self._lock`` held.
+        """
+        self._status = _CLOSED_STATUS
+        self._half_open_successes = 0
 
     @property
     def state(self) -> CircuitState:
         """
         Get current circuit breaker state.
         """
-        return self._state
+        return CircuitState(self._status.state)
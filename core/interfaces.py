@@ -40,8 +40,18 @@ class MessageBroker(ABC):
         pass
 
     @abstractmethod
-    def publish(self, routing_key: str, message: Dict[str, Any]) -> None:
-        """Publish a message to the broker."""
+    def publish(
+        self, routing_key: str, message: Dict[str, Any], flush: bool = True
+    ) -> None:
+        """
+        Publish a message to the broker.
+
+        With ``flush=False`` the broker may buffer the message until flush().
+        """
+        pass
+
+    def flush(self) -> None:
+        """Send any buffered messages; a no-op for brokers that do not buffer."""
         pass
 
 
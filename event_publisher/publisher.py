@@ -1,7 +1,8 @@
-from typing import Dict, Any, Optional, List
+import inspect
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List
 from core.interfaces import CircuitBreaker, MessageBroker
-from message_broker.broker import RabbitMQBroker
-from config import CircuitBreakerConfig
+from config import CircuitBreakerConfig, get_circuit_breaker_config
 from logging_utils import CorrelatedLogger
 from exceptions import PublishError
 
@@ -18,9 +19,9 @@ class EventProducer:
 
     def __init__(
         self,
-        message_broker: RabbitMQBroker,
+        message_broker: MessageBroker,
         circuit_breaker: CircuitBreaker,
-        config: CircuitBreakerConfig = CircuitBreakerConfig(),
+        config: Optional[CircuitBreakerConfig] = None,
         logger: Optional[CorrelatedLogger] = None,
     ):
         """
@@ -34,29 +35,59 @@ class EventProducer:
         """
         self._message_broker = message_broker
         self._circuit_breaker = circuit_breaker
-        self._config = config
+        self._config = config or get_circuit_breaker_config()
         self._logger = logger or CorrelatedLogger(__name__)
 
-        # Dictionary to store event type generators
-        self._event_generators: Dict[str, callable] = {}
+        # Generators are registered into a builder dict and looked up through
+        # a read-only view, which start() replaces with a frozen snapshot
+        self._registered_generators: Dict[str, callable] = {}
+        self._event_generators: Mapping[str, callable] = MappingProxyType(
+            self._registered_generators
+        )
+        self._frozen = False
 
     def register_event_generator(self, event_type: str, generator: callable) -> None:
         """
         Register an event generator function for a specific event type.
 
+        Generators are called as ``generator(event_type, **additional_data)``
+        and must return the complete message, including its ``type`` key;
+        declare ``event_type`` positional-only so additional data may use that
+        key. Legacy generators that can be called without arguments are
+        wrapped so that the additional data and event type are merged into
+        their result.
+
         Args:
             event_type (str): The type of event to generate
             generator (callable): A function that creates the event message
 
         Logs the registration of a new event generator.
+
+        Raises:
+            PublishError: If the producer has already been started
         """
-        self._event_generators[event_type] = generator
+        if self._frozen:
+            raise PublishError(
+                "Cannot register event generators after the producer has started",
+                context={"event_type": event_type}
+            )
+
+        if not _accepts_event_context(generator):
+            generator = _wrap_legacy_generator(generator)
+
+        self._registered_generators[event_type] = generator
         self._logger.info(
             "Registered event generator",
             extra={"event_type": event_type}
         )
 
-    def publish(self, event_type: str, routing_key: str, additional_data: Dict[str, Any] = None) -> None:
+    def publish(
+        self,
+        event_type: str,
+        routing_key: str,
+        additional_data: Dict[str, Any] = None,
+        flush: bool = True,
+    ) -> None:
         """
         Publish an event using the registered generator for the event type.
 
@@ -64,34 +95,44 @@ class EventProducer:
             event_type (str): The type of event to publish
             routing_key (str): The routing key for message routing
             additional_data (Dict[str, Any], optional): Additional data to merge with generated event
+            flush (bool, optional): Send immediately. When False the event is
+                buffered by the broker and sent in a batch by flush(); a
+                failed batch is reported by the call that sends it
 
         Raises:
             PublishError: If event generation or publishing fails
         """
         try:
             # Find the appropriate event generator
-            generator = self._event_generators.get(event_type)
-            if not generator:
-                raise ValueError(f"No generator registered for event type: {event_type}")
-
-            # Generate the base event message
-            event_data = generator()
-
-            # Merge with additional data if provided
+            try:
+                generator = self._event_generators[event_type]
+            except KeyError:
+                raise ValueError(
+                    f"No generator registered for event type: {event_type}"
+                ) from None
+
+            # Generate the complete event message
             if additional_data:
-                event_data.update(additional_data)
-
-            # Ensure event type is set
-            event_data['type'] = event_type
-
-            self._circuit_breaker.execute(
-                self._message_broker.publish,
-                routing_key=routing_key,
-                message=event_data
-            )
+                event_data = generator(event_type, **additional_data)
+            else:
+                event_data = generator(event_type)
+
+            if flush:
+                self._circuit_breaker.execute(
+                    self._message_broker.publish,
+                    routing_key=routing_key,
+                    message=event_data,
+                )
+            else:
+                self._circuit_breaker.execute(
+                    self._message_broker.publish,
+                    routing_key=routing_key,
+                    message=event_data,
+                    flush=False,
+                )
 
             self._logger.info(
-                "Event published successfully",
+                "Event published successfully" if flush else "Event buffered",
                 extra={
                     "event_type": event_type,
                     "routing_key": routing_key
@@ -115,10 +156,29 @@ class EventProducer:
                 }
             )
 
+    def flush(self) -> None:
+        """
+        Send all events buffered by publish(..., flush=False).
+
+        Raises:
+            PublishError: If sending the buffered events fails
+        """
+        try:
+            self._circuit_breaker.execute(self._message_broker.flush)
+
+        except Exception as e:
+            self._logger.error(
+                "Error flushing buffered events",
+                extra={"error": str(e)}
+            )
+            raise PublishError(f"Failed to flush buffered events: {e}")
+
     def start(self, routing_keys: List[str]) -> None:
         """
         Prepare the message broker connection.
 
+        Once connected, the registered event generators are frozen.
+
         Args:
             routing_keys (List[str]): List of routing keys to prepare
 
@@ -129,6 +189,10 @@ class EventProducer:
             # Establish connection using circuit breaker
             self._circuit_breaker.execute(self._message_broker.connect)
 
+            # Generators are fixed once running; expose them read-only
+            self._event_generators = MappingProxyType(dict(self._registered_generators))
+            self._frozen = True
+
         except Exception as e:
             self._logger.error(
                 "Error starting event producer",
@@ -140,4 +204,31 @@ class EventProducer:
             raise PublishError(
                 f"Failed to start event producer: {e}",
                 context={"routing_keys": routing_keys}
-            )
\ No newline at end of file
+            )
+
+
+def _accepts_event_context(generator: callable) -> bool:
+    """
+    Check whether a generator follows the ``generator(event_type, **data)`` contract.
+
+    Generators that can be called without arguments are treated as legacy.
+    """
+    try:
+        inspect.signature(generator).bind()
+    except TypeError:
+        return True
+    except ValueError:
+        # Signature not introspectable; assume the legacy no-argument form
+        return False
+    return False
+
+
+def _wrap_legacy_generator(generator: callable) -> callable:
+    """
+    Adapt a no-argument generator to the ``generator(event_type, **data)`` contract.
+    """
+
+    def wrapped(event_type: str, /, **additional_data: Any) -> Dict[str, Any]:
+        return {**generator(), **additional_data, "type": event_type}
+
+    return wrapped
@@ -1,8 +1,9 @@
-import json
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional
+import serialization
 from core.interfaces import CircuitBreaker, EventHandler
 from message_broker.broker import RabbitMQBroker
-from config import CircuitBreakerConfig
+from config import CircuitBreakerConfig, get_circuit_breaker_config
 from logging_utils import CorrelatedLogger
 from exceptions import EventHandlingError
 
@@ -21,7 +22,7 @@ class EventSubscriber:
         self,
         message_broker: RabbitMQBroker,
         circuit_breaker: CircuitBreaker,
-        config: CircuitBreakerConfig = CircuitBreakerConfig(),
+        config: Optional[CircuitBreakerConfig] = None,
         logger: Optional[CorrelatedLogger] = None,
     ):
         """
@@ -36,18 +37,32 @@ class EventSubscriber:
         # Existing implementation remains the same
         self._message_broker = message_broker
         self._circuit_breaker = circuit_breaker
-        self._config = config
+        self._config = config or get_circuit_breaker_config()
         self._logger = logger or CorrelatedLogger(__name__)
 
-        self._handlers: Dict[str, EventHandler] = {}
+        # Handlers are registered into a builder dict and looked up through a
+        # read-only view, which start() replaces with a frozen snapshot
+        self._registered_handlers: Dict[str, EventHandler] = {}
+        self._handlers: Mapping[str, EventHandler] = MappingProxyType(
+            self._registered_handlers
+        )
+        self._frozen = False
 
     def register_handler(self, event_type: str, handler: EventHandler) -> None:
         """
         Register an event handler for a specific event type.
+
+        Handlers can only be registered before the subscriber is started.
         """
-        self._handlers[event_type] = handler
+        if self._frozen:
+            raise EventHandlingError(
+                "Cannot register handlers after the subscriber has started",
+                context={"event_type": event_type},
+            )
+
+        self._registered_handlers[event_type] = handler
         self._logger.info(
-            f"Registered handler for event type", extra={"event_type": event_type}
+            "Registered handler for event type", extra={"event_type": event_type}
         )
 
     def start(self, queue_name: str, routing_keys: List[str]) -> None:
@@ -58,6 +73,10 @@ class EventSubscriber:
             # Use circuit breaker to protect connection
             self._circuit_breaker.execute(self._message_broker.connect)
 
+            # Handlers are fixed once consuming; expose them read-only
+            self._handlers = MappingProxyType(dict(self._registered_handlers))
+            self._frozen = True
+
             # Use the broker's consume method with our custom message processing
             self._message_broker.consume(
                 queue_name=queue_name,
@@ -81,36 +100,50 @@ class EventSubscriber:
         Process individual message with error handling and retry logic.
         """
         try:
-            event_data = json.loads(body)
-            event_type = event_data.get("type")
-
-            # Find and execute appropriate handler
-            handler = self._handlers.get(event_type)
-            if handler:
-                try:
-                    handler.handle(event_data)
-                    # Acknowledge message on successful processing
-                    channel.basic_ack(delivery_tag=method.delivery_tag)
-                except Exception as handler_error:
-                    self._logger.error(
-                        "Handler error for event type",
-                        extra={"event_type": event_type, "error": str(handler_error)},
-                    )
-                    # Negative acknowledgement to requeue message
-                    channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
-            else:
-                self._logger.warning(
-                    "No handler for event type", extra={"event_type": event_type}
-                )
-                # Acknowledge unhandled messages to prevent infinite requeue
-                channel.basic_ack(delivery_tag=method.delivery_tag)
-
-        except json.JSONDecodeError:
-            self._logger.error("Received malformed message")
-            channel.basic_ack(delivery_tag=method.delivery_tag)
+            self._dispatch_message(channel, method, body)
         except Exception as e:
             self._logger.error(
                 "Unexpected error processing message", extra={"error": str(e)}
             )
             # Do not requeue for unexpected errors
             channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+
+    def _dispatch_message(self, channel, method, body):
+        """
+        Decode a message, route it to its handler and acknowledge it.
+        """
+        try:
+            event_data = serialization.loads(body)
+        except serialization.JSONDecodeError:
+            event_data = None
+
+        # Acknowledge malformed messages, they can never be processed
+        event_type = event_data.get("type") if isinstance(event_data, dict) else None
+        if not isinstance(event_type, str):
+            self._logger.error("Received malformed message")
+            channel.basic_ack(delivery_tag=method.delivery_tag)
+            return
+
+        # Find appropriate handler
+        handler = self._handlers.get(event_type)
+        if handler is None:
+            self._logger.warning(
+                "No handler for event type", extra={"event_type": event_type}
+            )
+            # Acknowledge unhandled messages to prevent infinite requeue
+            channel.basic_ack(delivery_tag=method.delivery_tag)
+            return
+
+        try:
+            handler.handle(event_data)
+        except Exception as handler_error:
+            self._logger.error(
+                "Handler error for event type",
+                extra={"event_type": event_type, "error": str(handler_error)},
+            )
+            # Negative acknowledgement to requeue message
+            channel.basic_nack(delivery_tag=method.delivery_tag, requeue=True)
+            return
+
+        # Acknowledge message on successful processing
+        channel.basic_ack(delivery_tag=method.delivery_tag)
@@ -1,7 +1,7 @@
 import logging
 import uuid
 from typing import Dict, Any, Optional
-import json
+import serialization
 
 
 class CorrelatedLogger:
@@ -14,6 +14,7 @@ class CorrelatedLogger:
     Attributes:
         _logger (logging.Logger): Internal logger instance
         _correlation_id (str): Unique identifier for log entry tracing
+        _adapter (logging.LoggerAdapter): Adapter with the correlation ID pre-bound
     """
 
     def __init__(
@@ -37,36 +38,79 @@ class CorrelatedLogger:
         self._logger.handlers.clear()
         self._logger.addHandler(console_handler)
         self._correlation_id = correlation_id or str(uuid.uuid4())
+        self._adapter = _CorrelationAdapter(
+            self._logger, {"correlation_id": self._correlation_id}
+        )
+
+    def _log(
+        self,
+        level: int,
+        message: str,
+        args: tuple = (),
+        extra: Optional[Dict[str, Any]] = None,
+        exc_info: bool = False,
+    ):
+        self._adapter.log(level, message, *args, exc_info=exc_info, extra=extra)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at the given level would be emitted."""
+        return self._logger.isEnabledFor(level)
 
-    def _log(self, level: int, message: str, extra: Optional[Dict[str, Any]] = None):
-        extra = extra or {}
-        extra["correlation_id"] = self._correlation_id
+    def info(self, message: str, *args, **kwargs):
+        """
+        Log info message with optional extra context.
 
-        self._logger.log(level, message, extra=extra)
+        Positional ``args`` are %-interpolated into the message only if the
+        record is emitted, as with the standard library logger.
+        """
+        self._log(logging.INFO, message, args, kwargs)
 
-    def info(self, message: str, **kwargs):
-        """Log info message with optional extra context."""
-        self._log(logging.INFO, message, kwargs)
+    def error(self, message: str, *args, exc_info: bool = False, **kwargs):
+        """
+        Log error message with optional extra context.
 
-    def error(self, message: str, **kwargs):
-        """Log error message with optional extra context."""
-        self._log(logging.ERROR, message, kwargs)
+        The active exception traceback is attached when ``exc_info`` is set;
+        it is only formatted if a handler actually emits the record.
+        """
+        self._log(logging.ERROR, message, args, kwargs, exc_info)
 
-    def warning(self, message: str, **kwargs):
+    def warning(self, message: str, *args, **kwargs):
         """Log warning message with optional extra context."""
-        self._log(logging.WARNING, message, kwargs)
+        self._log(logging.WARNING, message, args, kwargs)
 
-    def debug(self, message: str, **kwargs):
+    def debug(self, message: str, *args, **kwargs):
         """Log debug message with optional extra context."""
-        self._log(logging.DEBUG, message, kwargs)
+        self._log(logging.DEBUG, message, args, kwargs)
+
+
+class _CorrelationAdapter(logging.LoggerAdapter):
+    """
+    Logger adapter that stamps the bound correlation ID onto each record.
+
+    Unlike the stdlib default, per-call ``extra`` context is preserved
+    rather than replaced by the adapter's own mapping.
+    """
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+        if extra:
+            extra.update(self.extra)
+        else:
+            kwargs["extra"] = self.extra
+        return msg, kwargs
 
 
 class JsonFormatter(logging.Formatter):
-    """Custom JSON log formatter."""
+    """
+    Custom JSON log formatter.
+
+    Timestamps are emitted as epoch seconds taken directly from the record,
+    avoiding per-record strftime formatting.
+    """
 
     def format(self, record):
         log_record = {
-            "timestamp": self.formatTime(record),
+            "timestamp": record.created,
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
@@ -78,4 +122,10 @@ class JsonFormatter(logging.Formatter):
         if hasattr(record, "extra"):
             log_record.update(record.extra)
 
-        return json.dumps(log_record)
+        # Format the traceback lazily, once per record
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_record["exception_trace"] = record.exc_text
+
+        return serialization.dumps(log_record).decode()
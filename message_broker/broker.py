@@ -1,12 +1,16 @@
-import json
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
 import pika
-from typing import Dict, Any, Optional, List, Callable
-from config import RabbitMQConfig
+from typing import Dict, Any, Optional, List, Callable, Tuple
+import serialization
+from core.interfaces import MessageBroker
+from config import RabbitMQConfig, get_rabbitmq_config
 from logging_utils import CorrelatedLogger
 from exceptions import MessageBrokerConnectionError, PublishError
 
 
-class RabbitMQBroker:
+class RabbitMQBroker(MessageBroker):
     """
     Manages RabbitMQ message broker connections and communication.
 
@@ -21,17 +25,18 @@ class RabbitMQBroker:
 
     def __init__(
         self,
-        config: RabbitMQConfig = RabbitMQConfig(),
+        config: Optional[RabbitMQConfig] = None,
         logger: Optional[CorrelatedLogger] = None,
     ):
         """
         Initialize RabbitMQ broker with configurable parameters.
 
         Args:
-            config (RabbitMQConfig): Configuration for RabbitMQ connection
+            config (RabbitMQConfig, optional): Configuration for RabbitMQ connection
             logger (CorrelatedLogger, optional): Logger for tracking broker activities
         """
 
+        config = config or get_rabbitmq_config()
         self._config = config
         self._host = config.host
         self._port = config.port
@@ -39,6 +44,8 @@ class RabbitMQBroker:
         self._password = config.password
         self._virtual_host = config.virtual_host
         self._event_exchange = config.event_exchange
+        self._prefetch_count = config.prefetch_count
+        self._consumer_workers = config.consumer_workers
 
         self._logger = logger or CorrelatedLogger(__name__)
 
@@ -47,10 +54,25 @@ class RabbitMQBroker:
             None
         )
 
+        # Publish properties are constant, so build them once
+        self._publish_properties = pika.BasicProperties(
+            delivery_mode=2, content_type="application/json"
+        )
+
         # Connection retry configuration
         self._max_retries = 3
         self._retry_delay = 5  # seconds
 
+        # Messages published with flush=False wait here until the next flush
+        self._pending: List[Tuple[str, bytes]] = []
+        self._publish_batch_size = 100
+
+        # Publish logging is coalesced into one summary per interval
+        self._info_enabled = False
+        self._publish_log_interval = 1000
+        self._publish_count = 0
+        self._published_bytes = 0
+
     def connect(self) -> None:
         """
         Establish a connection to RabbitMQ with retry mechanism.
@@ -66,11 +88,15 @@ class RabbitMQBroker:
                 retry_delay=self._retry_delay,
             )
 
+            # Never carry messages buffered for a previous connection over
+            self._pending = []
+
             self._connection = pika.BlockingConnection(parameters)
             self._channel = self._connection.channel()
             self._channel.exchange_declare(
                 exchange=self._event_exchange, exchange_type="topic", durable=True
             )
+            self._info_enabled = self._logger.is_enabled_for(logging.INFO)
 
             self._logger.info(
                 "Successfully connected to RabbitMQ",
@@ -90,52 +116,175 @@ class RabbitMQBroker:
 
     def disconnect(self) -> None:
         """
-        Close RabbitMQ connection gracefully.
+        Close RabbitMQ connection gracefully, sending any buffered messages first.
+
+        The buffer is cleared either way, so stale messages can never be sent
+        on a later connection.
         """
         if self._connection and not self._connection.is_closed:
-            self._connection.close()
-            self._logger.info("RabbitMQ connection closed")
+            try:
+                if self._pending:
+                    self.flush()
+            finally:
+                self._pending = []
+                self._connection.close()
+                self._logger.info("RabbitMQ connection closed")
+
+        # Publishing relies on a None channel to detect a closed broker
+        self._channel = None
+        self._connection = None
 
-    def publish(self, routing_key: str, message: Dict[str, Any]) -> None:
+    def publish(
+        self, routing_key: str, message: Dict[str, Any], flush: bool = True
+    ) -> None:
         """
         Publish a message to the event exchange.
+
+        By default the message is sent immediately, after any messages still
+        buffered. With ``flush=False`` the encoded message is buffered and
+        sent by the next flush(), which also happens automatically once the
+        buffer reaches the batch size, so the buffer never grows past it.
         """
-        if not self._channel or self._channel.is_closed:
+        if self._channel is None:
             raise MessageBrokerConnectionError("RabbitMQ channel is not open")
 
         try:
-            message_body = json.dumps(message)
-            self._channel.basic_publish(
-                exchange=self._event_exchange,
-                routing_key=routing_key,
-                body=message_body,
-                properties=pika.BasicProperties(
-                    delivery_mode=2, content_type="application/json"
-                ),
-                mandatory=True,
+            message_body = serialization.dumps(message)
+        except Exception as e:
+            self._logger.error(
+                "Failed to publish message",
+                extra={"error": str(e), "routing_key": routing_key},
             )
+            raise PublishError(f"Message publication failed: {e}")
 
-            self._logger.info(
-                f"Published message to {routing_key}",
-                extra={"routing_key": routing_key, "message_size": len(message_body)},
+        if flush:
+            self.flush()
+            self._send([(routing_key, message_body)])
+            return
+
+        self._pending.append((routing_key, message_body))
+        if len(self._pending) >= self._publish_batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Send all buffered messages to the event exchange.
+
+        The buffer is emptied before sending. Messages that could not be
+        sent are dropped, never retried, and their count is reported on the
+        raised error.
+        """
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        self._send(pending)
+
+    def _send(self, messages: List[Tuple[str, bytes]]) -> None:
+        """
+        Publish encoded messages to the event exchange in order.
+        """
+        # Bind hot attributes to locals; a closed channel is reported by
+        # pika itself rather than checked before every publish
+        channel = self._channel
+        if channel is None:
+            raise MessageBrokerConnectionError(
+                "RabbitMQ channel is not open",
+                context={"unsent_messages": len(messages)},
+            )
+        basic_publish = channel.basic_publish
+        exchange = self._event_exchange
+        properties = self._publish_properties
+        info_enabled = self._info_enabled
+
+        sent = 0
+        try:
+            for routing_key, message_body in messages:
+                basic_publish(
+                    exchange=exchange,
+                    routing_key=routing_key,
+                    body=message_body,
+                    properties=properties,
+                    mandatory=True,
+                )
+                sent += 1
+
+                if info_enabled:
+                    self._record_published(routing_key, len(message_body))
+
+        except (
+            pika.exceptions.ChannelWrongStateError,
+            pika.exceptions.ChannelClosed,
+            pika.exceptions.AMQPConnectionError,
+        ) as e:
+            unsent = len(messages) - sent
+            self._logger.error(
+                "RabbitMQ channel closed while publishing",
+                extra={"error": str(e), "unsent_messages": unsent},
+            )
+            raise MessageBrokerConnectionError(
+                f"RabbitMQ channel is not open: {e}",
+                context={"unsent_messages": unsent},
             )
 
         except Exception as e:
+            unsent = len(messages) - sent
             self._logger.error(
                 "Failed to publish message",
-                extra={"error": str(e), "routing_key": routing_key},
+                extra={
+                    "error": str(e),
+                    "routing_key": messages[sent][0],
+                    "unsent_messages": unsent,
+                },
+            )
+            raise PublishError(
+                f"Message publication failed: {e}",
+                context={"unsent_messages": unsent},
+            )
+
+    def _record_published(self, routing_key: str, message_size: int) -> None:
+        """
+        Count a published message, logging the first and every Nth one after it.
+        """
+        self._publish_count += 1
+        self._published_bytes += message_size
+
+        if (self._publish_count - 1) % self._publish_log_interval == 0:
+            self._logger.info(
+                "Published message to %s",
+                routing_key,
+                extra={
+                    "routing_key": routing_key,
+                    "message_size": message_size,
+                    "published_count": self._publish_count,
+                    "published_bytes": self._published_bytes,
+                },
             )
-            raise PublishError(f"Message publication failed: {e}")
 
     def consume(
-        self, queue_name: str, routing_keys: List[str], callback: Callable
+        self,
+        queue_name: str,
+        routing_keys: List[str],
+        callback: Callable,
+        prefetch_count: Optional[int] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Set up a consumer for specific routing keys.
+
+        At most ``prefetch_count`` unacknowledged messages are delivered at a
+        time. With more than one worker, the callback runs on a thread pool
+        and its ack/nack calls are scheduled back onto the connection thread.
+        Both default to the broker configuration.
         """
         if not self._channel or self._channel.is_closed:
             raise MessageBrokerConnectionError("RabbitMQ channel is not open")
 
+        if prefetch_count is None:
+            prefetch_count = self._prefetch_count
+        if max_workers is None:
+            max_workers = self._consumer_workers
+
         self._channel.queue_declare(queue=queue_name, durable=True)
 
         for key in routing_keys:
@@ -143,15 +292,102 @@ class RabbitMQBroker:
                 exchange=self._event_exchange, queue=queue_name, routing_key=key
             )
 
+        # Bound the number of in-flight deliveries
+        self._channel.basic_qos(prefetch_count=prefetch_count)
+
+        executor = None
+        on_message_callback = callback
+        if max_workers > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="rabbitmq-consumer"
+            )
+            worker_channel = _ThreadSafeAckChannel(self._connection, self._channel)
+
+            def on_message_callback(channel, method, properties, body):
+                executor.submit(
+                    self._run_worker_callback,
+                    callback,
+                    worker_channel,
+                    method,
+                    properties,
+                    body,
+                )
+
         # Set up consumer
         self._channel.basic_consume(
             queue=queue_name,
-            on_message_callback=callback,
+            on_message_callback=on_message_callback,
             auto_ack=False,  # Manual acknowledgment for reliability
         )
 
         self._logger.info(
-            f"Started consuming from {queue_name}",
-            extra={"queue_name": queue_name, "routing_keys": routing_keys},
+            "Started consuming from %s",
+            queue_name,
+            extra={
+                "queue_name": queue_name,
+                "routing_keys": routing_keys,
+                "prefetch_count": prefetch_count,
+                "max_workers": max_workers,
+            },
+        )
+        try:
+            self._channel.start_consuming()
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+                # Deliver acknowledgements scheduled by the last workers
+                if self._connection and not self._connection.is_closed:
+                    self._connection.process_data_events(time_limit=0)
+
+    def _run_worker_callback(
+        self, callback: Callable, worker_channel, method, properties, body
+    ) -> None:
+        """
+        Run a consumer callback on a worker thread.
+
+        Exceptions that escape the callback are logged and the delivery is
+        rejected without requeue, so it does not hold a prefetch slot forever.
+        """
+        try:
+            callback(worker_channel, method, properties, body)
+        except Exception as e:
+            self._logger.error(
+                "Unexpected error in consumer worker", extra={"error": str(e)}
+            )
+            worker_channel.basic_nack(delivery_tag=method.delivery_tag, requeue=False)
+
+
+class _ThreadSafeAckChannel:
+    """
+    Channel facade for consumer callbacks running on worker threads.
+
+    pika channels are not thread-safe, so acknowledgements are handed to
+    the connection's IO thread via add_callback_threadsafe.
+    """
+
+    def __init__(
+        self,
+        connection: pika.BlockingConnection,
+        channel: pika.adapters.blocking_connection.BlockingChannel,
+    ):
+        self._connection = connection
+        self._channel = channel
+
+    def basic_ack(self, delivery_tag: int = 0, multiple: bool = False) -> None:
+        self._connection.add_callback_threadsafe(
+            functools.partial(
+                self._channel.basic_ack, delivery_tag=delivery_tag, multiple=multiple
+            )
+        )
+
+    def basic_nack(
+        self, delivery_tag: int = 0, multiple: bool = False, requeue: bool = True
+    ) -> None:
+        self._connection.add_callback_threadsafe(
+            functools.partial(
+                self._channel.basic_nack,
+                delivery_tag=delivery_tag,
+                multiple=multiple,
+                requeue=requeue,
+            )
         )
-        self._channel.start_consuming()
@@ -0,0 +1,41 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON.
+
+    Uses orjson when it is installed and falls back to the standard
+    library otherwise.
+    """
+    if orjson is not None:
+        # Accept non-str dict keys, as the stdlib encoder does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(data: Any) -> Any:
+    """
+    Deserialize JSON from bytes or str.
+
+    Raises:
+        JSONDecodeError: If the input is not valid UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        # orjson reports invalid UTF-8 as a decode error; match it
+        raise json.JSONDecodeError(str(e), "", 0) from e
@@ -0,0 +1,206 @@
+import logging
+import threading
+import types
+import unittest
+from unittest import mock
+
+from config import CircuitBreakerConfig
+from core import circuit_breaker
+from core.circuit_breaker import DefaultCircuitBreaker
+from core.interfaces import CircuitState
+from exceptions import CircuitBreakerError
+from logging_utils import CorrelatedLogger
+
+
+class FakeClock:
+    """Controllable replacement for time.monotonic_ns."""
+
+    def __init__(self):
+        self.now_ns = 0
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    def advance(self, seconds):
+        self.now_ns += int(seconds * 1_000_000_000)
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+class DefaultCircuitBreakerTest(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        fake_time = types.SimpleNamespace(monotonic_ns=self.clock.monotonic_ns)
+        patcher = mock.patch.object(circuit_breaker, "time", fake_time)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_breaker(self, **overrides):
+        settings = {
+            "failure_threshold": 2,
+            "max_reset_timeout": 4.0,
+            "backoff_factor": 2.0,
+            "initial_backoff": 1.0,
+            "half_open_success_threshold": 2,
+            "half_open_max_concurrent_probes": 1,
+        }
+        settings.update(overrides)
+        logger = CorrelatedLogger("test_circuit_breaker", level=logging.CRITICAL)
+        return DefaultCircuitBreaker(CircuitBreakerConfig(**settings), logger=logger)
+
+    def trip(self, breaker, failures=2):
+        for _ in range(failures):
+            with self.assertRaises(RuntimeError):
+                breaker.execute(fail)
+
+    def test_trips_after_failure_threshold(self):
+        breaker = self.make_breaker()
+
+        with self.assertRaises(RuntimeError):
+            breaker.execute(fail)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+        with self.assertRaises(RuntimeError):
+            breaker.execute(fail)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+    def test_open_circuit_rejects_until_deadline(self):
+        breaker = self.make_breaker()
+        self.trip(breaker)
+        func = mock.Mock(return_value="ok")
+
+        self.clock.advance(0.999)
+        with self.assertRaises(CircuitBreakerError):
+            breaker.execute(func)
+        func.assert_not_called()
+
+        self.clock.advance(0.001)
+        self.assertEqual(breaker.execute(func), "ok")
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+
+    def test_half_open_closes_after_required_successes(self):
+        breaker = self.make_breaker(half_open_success_threshold=3)
+        self.trip(breaker)
+        self.clock.advance(1.0)
+
+        for _ in range(2):
+            breaker.execute(lambda: None)
+            self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+
+        breaker.execute(lambda: None)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_failed_probe_reopens_with_longer_backoff(self):
+        breaker = self.make_breaker()
+        self.trip(breaker)
+        self.clock.advance(1.0)
+
+        with self.assertRaises(RuntimeError):
+            breaker.execute(fail)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+        # Second trip waits initial_backoff * backoff_factor
+        self.clock.advance(1.999)
+        with self.assertRaises(CircuitBreakerError):
+            breaker.execute(lambda: None)
+        self.clock.advance(0.001)
+        breaker.execute(lambda: None)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+
+    def test_backoff_is_capped(self):
+        breaker = self.make_breaker()
+        self.trip(breaker)
+
+        # Waits grow 1s, 2s, 4s and then stay at max_reset_timeout
+        for wait in (1.0, 2.0, 4.0, 4.0):
+            self.clock.advance(wait)
+            with self.assertRaises(RuntimeError):
+                breaker.execute(fail)
+
+        self.clock.advance(3.999)
+        with self.assertRaises(CircuitBreakerError):
+            breaker.execute(lambda: None)
+        self.clock.advance(0.001)
+        breaker.execute(lambda: None)
+
+    def test_successful_recovery_resets_backoff(self):
+        breaker = self.make_breaker(half_open_success_threshold=1)
+        self.trip(breaker)
+        self.clock.advance(1.0)
+        with self.assertRaises(RuntimeError):
+            breaker.execute(fail)
+        self.clock.advance(2.0)
+        breaker.execute(lambda: None)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+        self.trip(breaker)
+        self.clock.advance(1.0)
+        breaker.execute(lambda: None)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_concurrent_probes_are_limited(self):
+        breaker = self.make_breaker()
+        self.trip(breaker)
+        self.clock.advance(1.0)
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_probe():
+            started.set()
+            release.wait(5)
+
+        probe = threading.Thread(target=breaker.execute, args=(slow_probe,))
+        probe.start()
+        self.assertTrue(started.wait(5))
+
+        with self.assertRaises(CircuitBreakerError):
+            breaker.execute(lambda: None)
+
+        release.set()
+        probe.join(5)
+
+        # The slot is free again once the first probe has finished
+        breaker.execute(lambda: None)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+    def test_failures_while_open_do_not_extend_backoff(self):
+        breaker = self.make_breaker(failure_threshold=1)
+
+        started = threading.Barrier(3)
+        release = threading.Event()
+
+        def slow_failure():
+            started.wait(5)
+            release.wait(5)
+            raise RuntimeError("boom")
+
+        def run():
+            with self.assertRaises(RuntimeError):
+                breaker.execute(slow_failure)
+
+        threads = [threading.Thread(target=run) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        # Only the first failure trips the circuit; the wait stays at 1s
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+        self.clock.advance(1.0)
+        breaker.execute(lambda: None)
+        self.assertEqual(breaker.state, CircuitState.HALF_OPEN)
+
+    def test_rejects_invalid_probe_settings(self):
+        with self.assertRaises(ValueError):
+            self.make_breaker(half_open_max_concurrent_probes=0)
+        with self.assertRaises(ValueError):
+            self.make_breaker(half_open_success_threshold=0)
+
+
+if __name__ == "__main__":
+    unittest.main()